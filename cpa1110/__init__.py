@@ -1,4 +1,5 @@
 from .device import CPA1110
+from .snapshot import CPASnapshot
 from .enums import (
     Connection,
     OperatingState,
@@ -10,6 +11,7 @@ from .enums import (
 
 __all__ = [
     "CPA1110",
+    "CPASnapshot",
     "Connection",
     "TemperatureUnits",
     "PressureUnits",
@@ -0,0 +1,160 @@
+"""
+Register decoding helpers used on every refresh.
+
+Everything here is fully annotated and avoids dynamic features, so the module
+can be compiled ahead of time with mypyc (``mypyc cpa1110/_decode.py``). The
+compiled extension then takes precedence over this file on import; without it
+the pure Python implementation is used.
+"""
+
+import struct
+from functools import lru_cache
+from typing import Callable, Dict, List, Sequence
+
+from .enums import (
+    OperatingState,
+    PressureUnits,
+    TemperatureUnits,
+    Warnings,
+    Errors,
+)
+from .snapshot import CPASnapshot
+
+_U16 = struct.Struct("<H")
+_U16_PAIR = struct.Struct("<HH")
+_FLOAT = struct.Struct("<f")
+
+# number of input registers read by a full refresh
+REGISTER_COUNT = 33
+
+# precompiled structs packing 0 up to REGISTER_COUNT registers into raw bytes
+_REGISTER_STRUCTS: List[struct.Struct] = [
+    struct.Struct(f"<{count}H") for count in range(REGISTER_COUNT + 1)
+]
+
+# size in bytes of the packed full input register block
+REGISTER_BLOCK_SIZE: int = _REGISTER_STRUCTS[REGISTER_COUNT].size
+
+# the full 33 register input block; registers 0-5 are 16 bit integers, 6-27 are
+# 11 floats and 28-32 are 16 bit integers again
+_SNAPSHOT_UNPACK = struct.Struct("<6H11f5H").unpack
+
+# register value to enum member lookup tables
+_OPERATING_STATES: Dict[int, OperatingState] = {
+    member.value: member for member in OperatingState
+}
+_PRESSURE_UNITS: Dict[int, PressureUnits] = {
+    member.value: member for member in PressureUnits
+}
+_TEMPERATURE_UNITS: Dict[int, TemperatureUnits] = {
+    member.value: member for member in TemperatureUnits
+}
+
+# constructing a flag validates its bits on every call; the warning and error
+# states rarely change between reads, so reuse previously built flags
+_warnings: Callable[[int], Warnings] = lru_cache(maxsize=128)(Warnings)
+_errors: Callable[[int], Errors] = lru_cache(maxsize=128)(Errors)
+
+
+# utility functions (see manual pp 21-22); register values are expected to be
+# unsigned 16 bit integers, as returned by pymodbus
+def to_float(b12: int, b34: int) -> float:
+    return _FLOAT.unpack(_U16_PAIR.pack(b12, b34))[0]
+
+
+def to_int(b12: int, b34: int) -> int:
+    # most integer registers are 16 bit, with an empty upper word
+    if b34 == 0:
+        return b12
+    value = (b34 << 16) | b12
+    return value - 0x100000000 if value & 0x80000000 else value
+
+
+def _coerce_operating_state(state: int) -> OperatingState:
+    return _OPERATING_STATES.get(state, OperatingState.NA)
+
+
+def _coerce_pressure_units(state: int) -> PressureUnits:
+    return _PRESSURE_UNITS.get(state, PressureUnits.NA)
+
+
+def _coerce_temperature_units(state: int) -> TemperatureUnits:
+    return _TEMPERATURE_UNITS.get(state, TemperatureUnits.NA)
+
+
+def pack_registers(registers: Sequence[int]) -> bytes:
+    """
+    Pack register values into raw little-endian bytes
+
+    Args:
+        registers (Sequence[int]): up to 33 unsigned 16 bit register values
+
+    Returns:
+        bytes: raw register values
+    """
+    return _REGISTER_STRUCTS[len(registers)].pack(*registers)
+
+
+def decode_snapshot(raw: bytes) -> CPASnapshot:
+    """
+    Decode all values from the raw bytes of the 33 input registers
+
+    Args:
+        raw (bytes): little-endian packed input registers
+
+    Returns:
+        CPASnapshot: decoded register values
+    """
+    fields = _SNAPSHOT_UNPACK(raw)
+    return CPASnapshot(
+        _coerce_operating_state(fields[0]),
+        _warnings(to_int(fields[3], fields[2])),
+        _errors(fields[3]),
+        fields[6],
+        fields[7],
+        fields[8],
+        fields[9],
+        fields[10],
+        fields[11],
+        fields[12],
+        fields[13],
+        fields[14],
+        fields[15],
+        fields[16],
+        _coerce_pressure_units(fields[17]),
+        _coerce_temperature_units(fields[18]),
+        fields[19],
+        fields[20],
+        fields[21],
+    )
+
+
+# decoders for the raw bytes of a narrow register read, used when a single
+# property fetches only its own registers
+def decode_u16(raw: bytes) -> int:
+    return _U16.unpack(raw)[0]
+
+
+def decode_float(raw: bytes) -> float:
+    return _FLOAT.unpack(raw)[0]
+
+
+def decode_operating_state(raw: bytes) -> OperatingState:
+    return _coerce_operating_state(_U16.unpack(raw)[0])
+
+
+def decode_warnings(raw: bytes) -> Warnings:
+    high, low = _U16_PAIR.unpack(raw)
+    return _warnings(to_int(low, high))
+
+
+def decode_errors(raw: bytes) -> Errors:
+    return _errors(_U16.unpack(raw)[0])
+
+
+def decode_pressure_units(raw: bytes) -> PressureUnits:
+    return _coerce_pressure_units(_U16.unpack(raw)[0])
+
+
+def decode_temperature_units(raw: bytes) -> TemperatureUnits:
+    return _coerce_temperature_units(_U16.unpack(raw)[0])
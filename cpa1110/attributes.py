@@ -1,25 +1,45 @@
-import struct
+from typing import Any, Optional, Union, overload
 
-# utility functions (see manual pp 21-22)
-def to_float(b12, b34) -> float:
-    return struct.unpack("f", struct.pack("H", b12) + struct.pack("H", b34))[0]
+from ._decode import decode_float
 
+# to_float and to_int moved to _decode; re-exported for backwards compatibility
+from ._decode import to_float, to_int
 
-def to_int(b12, b34) -> int:
-    return struct.unpack("i", struct.pack("H", b12) + struct.pack("H", b34))[0]
+__all__ = ["FloatProperty", "to_float", "to_int"]
 
 
 class FloatProperty:
     def __init__(self, index1: int, index2: int, read_only: bool = True):
+        if index2 != index1 + 1:
+            raise ValueError("Float registers have to be consecutive")
         self._read_only = read_only
         self._index1 = index1
         self._index2 = index2
+        # floats occupy registers 6-27 and follow OperatingState, Warnings and
+        # Errors in the snapshot
+        field, remainder = divmod(index1 - 6, 2)
+        if remainder or not 0 <= field < 11:
+            raise ValueError(f"Registers {index1} and {index2} do not hold a float")
+        # position of the decoded value in the cached snapshot
+        self._field = 3 + field
 
-    def __get__(self, instance, owner) -> float:
-        instance._rr = instance._read_input_register_response()
-        return to_float(
-            instance._rr.registers[self._index1], instance._rr.registers[self._index2]
-        )
+    @overload
+    def __get__(self, instance: None, owner: Optional[type]) -> "FloatProperty":
+        ...
+
+    @overload
+    def __get__(self, instance: Any, owner: Optional[type]) -> float:
+        ...
+
+    def __get__(
+        self, instance: Any, owner: Optional[type]
+    ) -> Union["FloatProperty", float]:
+        if instance is None:
+            return self
+        if instance.narrow_reads and instance._is_stale():
+            return instance._read_narrow(self._index1, 2, decode_float)
+        instance._maybe_refresh()
+        return instance._current_snapshot()[self._field]
 
     def __set__(self, instance, value) -> None:
         if self._read_only:
@@ -1,15 +1,38 @@
+import threading
+import time
+from contextlib import contextmanager
 from functools import wraps
 from ipaddress import ip_address
-from typing import Callable, Optional
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
 
 from pymodbus import client
 from pymodbus.constants import Defaults
 from pymodbus.exceptions import ModbusIOException
 from pymodbus.framer import rtu_framer, socket_framer
-from pymodbus.register_read_message import ReadInputRegistersResponse
 
-from cpa1110.attributes import FloatProperty, to_int
+from cpa1110.attributes import FloatProperty
 
+from ._decode import (
+    REGISTER_BLOCK_SIZE,
+    REGISTER_COUNT,
+    decode_errors,
+    decode_operating_state,
+    decode_pressure_units,
+    decode_snapshot,
+    decode_temperature_units,
+    decode_u16,
+    decode_warnings,
+    pack_registers,
+)
 from .enums import (
     Connection,
     OperatingState,
@@ -18,15 +41,69 @@ from .enums import (
     Warnings,
     Errors,
 )
+from .snapshot import CPASnapshot
+
+if TYPE_CHECKING:
+    import numpy as np
+
+
+# numpy record layout of the raw input registers, used by read_snapshots;
+# registers the driver does not decode keep their raw register names, and
+# Errors is decoded from the same register as WarningsLow
+_SNAPSHOT_DTYPE = [
+    ("OperatingState", "<u2"),
+    ("Register1", "<u2"),
+    ("WarningsHigh", "<u2"),
+    ("WarningsLow", "<u2"),
+    ("Register4", "<u2"),
+    ("Register5", "<u2"),
+    ("CoolantInTemperature", "<f4"),
+    ("CoolantOutTemperature", "<f4"),
+    ("OilTemperature", "<f4"),
+    ("HeliumTemperature", "<f4"),
+    ("LowPressure", "<f4"),
+    ("LowPressureAverage", "<f4"),
+    ("HighPressure", "<f4"),
+    ("HighPressureAverage", "<f4"),
+    ("DeltaPressureAverage", "<f4"),
+    ("MotorCurrent", "<f4"),
+    ("HoursOfOperation", "<f4"),
+    ("PressureUnits", "<u2"),
+    ("TemperatureUnits", "<u2"),
+    ("PanelSerialNumber", "<u2"),
+    ("ModelNumber", "<u2"),
+    ("SoftwareRev", "<u2"),
+]
+
+# property name to CPASnapshot field index
+_SNAPSHOT_FIELDS = {name: index for index, name in enumerate(CPASnapshot._fields)}
+
+
+class _FrozenDepth(threading.local):
+    # nesting depth of frozen() blocks in the current thread
+    depth = 0
+
+
+def _read_input_register(
+    start: int, count: int, decode: Callable[[bytes], Any]
+) -> Callable:
+    """
+    Refresh the registers before calling the property getter. With
+    narrow_reads enabled only the registers start to start + count are read
+    and decoded with decode.
+    """
 
+    def decorator(func: Callable) -> Callable:
+        @wraps(func)
+        def wrapper(self, *args, **kwargs):
+            if self.narrow_reads and self._is_stale():
+                return self._read_narrow(start, count, decode)
+            self._maybe_refresh()
+            return func(self, *args, **kwargs)
 
-def _read_input_register(func: Callable) -> Callable:
-    @wraps
-    def wrapper(self, *args, **kwargs):
-        self._rr = self._read_input_register_reponse()
-        return func(self, *args, **kwargs)
+        return wrapper
 
-    return wrapper
+    return decorator
 
 
 class CPA1110:
@@ -47,7 +124,29 @@ class CPA1110:
         resource_name: str,
         connection_type: Connection,
         port: int = Defaults.TcpPort,
+        auto_refresh: bool = True,
+        cache_ttl: float = 0.05,
+        narrow_reads: bool = False,
     ) -> None:
+        """
+        Args:
+            resource_name (str): serial port or IP address of the compressor
+            connection_type (Connection): serial or TCP connection
+            port (int, optional): TCP port. Defaults to Defaults.TcpPort.
+            auto_refresh (bool, optional): re-read the registers when accessing
+                a property. Defaults to True.
+            cache_ttl (float, optional): time in seconds for which a register
+                read, full or narrow, is reused by subsequent property accesses
+                when auto_refresh is enabled. Defaults to 0.05.
+            narrow_reads (bool, optional): when a property access needs a
+                refresh, only read the registers of that property instead of
+                all 33. Each property caches its own narrow read for
+                cache_ttl. Useful for polling single values over slow serial
+                links. Defaults to False.
+        """
+        self.auto_refresh = auto_refresh
+        self.cache_ttl = cache_ttl
+        self.narrow_reads = narrow_reads
         if connection_type == Connection.SERIAL:
             self.client = client.ModbusSerialClient(
                 port=resource_name,
@@ -68,46 +167,248 @@ class CPA1110:
         else:
             raise ValueError("Cannot connect to device.")
 
-        self._rr: ReadInputRegistersResponse = self._read_input_register_response()
+        # bound client methods used on every transaction
+        self._read_fn = self.client.read_input_registers
+        self._write_fn = self.client.write_register
+        # serializes transactions and the cache updates that follow them, so
+        # control writes never interleave with reads; reentrant so refresh can
+        # hold it across the register read
+        self._lock = threading.RLock()
+
+        self._snapshot: Optional[CPASnapshot] = None
+        self._snapshot_timestamp = float("-inf")
+        # register window start to (timestamp, decoded value) of narrow reads
+        self._narrow_cache: Dict[int, Tuple[float, Any]] = {}
+        self._frozen = _FrozenDepth()
+        # with auto_refresh the first property access reads the registers
+        if not auto_refresh:
+            self.refresh()
 
     def enable_compressor(self) -> None:
         """
         Start the compressor
         """
-        self.client.write_register(1, 0x0001, unit=16)
+        with self._lock:
+            self._write_fn(1, 0x0001, unit=16)
+            # the operating state changes, force the next access to re-read
+            self._invalidate()
 
     def disable_compressor(self) -> None:
         """
         Stop the compressor
         """
-        self.client.write_register(1, 0x00FF, unit=16)
+        with self._lock:
+            self._write_fn(1, 0x00FF, unit=16)
+            # the operating state changes, force the next access to re-read
+            self._invalidate()
+
+    def _invalidate(self) -> None:
+        """
+        Mark all cached reads as stale, forcing the next access to re-read
+        """
+        self._snapshot_timestamp = float("-inf")
+        self._narrow_cache.clear()
 
-    def _read_input_register_response(self) -> ReadInputRegistersResponse:
+    def close(self) -> None:
+        """
+        Close the connection to the compressor
         """
-        Read registers
+        with self._lock:
+            self.client.close()
+
+    def __enter__(self) -> "CPA1110":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def refresh(self) -> CPASnapshot:
+        """
+        Read the input registers from the compressor and decode them
 
         Returns:
-            Optional[bool]: _description_
+            CPASnapshot: decoded register values
         """
-        read_input_register_response = self.client.read_input_registers(
-            1, count=33, slave=16
-        )
-        if isinstance(read_input_register_response, ModbusIOException):
-            raise read_input_register_response
-        else:
-            return read_input_register_response
+        with self._lock:
+            snapshot = decode_snapshot(self._read_input_registers())
+            self._snapshot = snapshot
+            self._snapshot_timestamp = time.monotonic()
+        return snapshot
+
+    def _current_snapshot(self) -> CPASnapshot:
+        """
+        Decoded values of the last read
+
+        Raises:
+            RuntimeError: if the registers were never read
+
+        Returns:
+            CPASnapshot: decoded register values
+        """
+        snapshot = self._snapshot
+        if snapshot is None:
+            raise RuntimeError("No registers read yet, call refresh() first")
+        return snapshot
+
+    @contextmanager
+    def frozen(self) -> Iterator["CPA1110"]:
+        """
+        Refresh the registers once if needed, then suppress automatic refreshes
+        inside the with block so every property access reuses that read. This
+        is the recommended way to read several properties together.
+
+        Blocks can be nested and only apply to the calling thread; other
+        threads keep refreshing as usual. A control write inside the block
+        still forces the next access to re-read.
+        """
+        self._maybe_refresh()
+        frozen = self._frozen
+        frozen.depth += 1
+        try:
+            yield self
+        finally:
+            frozen.depth -= 1
+
+    def _is_stale(self) -> bool:
+        """
+        Check if auto_refresh is enabled and the last read is older than
+        cache_ttl. Inside a frozen() block only invalidated reads are stale.
+        """
+        if not self.auto_refresh:
+            return False
+        if self._frozen.depth:
+            return self._snapshot_timestamp == float("-inf")
+        return time.monotonic() - self._snapshot_timestamp >= self.cache_ttl
+
+    def _maybe_refresh(self) -> None:
+        """
+        Refresh the registers if they are stale
+        """
+        if self._is_stale():
+            with self._lock:
+                # another thread may have refreshed while waiting for the lock
+                if self._is_stale():
+                    self.refresh()
+
+    def _read_registers(self, start: int, count: int) -> List[int]:
+        """
+        Read count input registers, starting at register index start
+
+        Raises:
+            ModbusIOException: if the read failed or returned too few registers
+
+        Returns:
+            List[int]: register values
+        """
+        with self._lock:
+            response = self._read_fn(1 + start, count=count, slave=16)
+        if response.isError():
+            if isinstance(response, ModbusIOException):
+                raise response
+            raise ModbusIOException(f"Error reading input registers: {response}")
+        registers = response.registers
+        if len(registers) != count:
+            raise ModbusIOException(
+                f"Expected {count} input registers, received {len(registers)}"
+            )
+        return registers
+
+    def _read_input_registers(self) -> bytes:
+        """
+        Read all input registers and pack them into raw little-endian bytes
+
+        Returns:
+            bytes: raw register values
+        """
+        # pymodbus returns uint16 register values; packing them as "H" raises a
+        # struct.error for anything out of range, so the decoders skip masking
+        return pack_registers(self._read_registers(0, REGISTER_COUNT))
+
+    def _read_range(self, start: int, count: int) -> bytes:
+        """
+        Read a range of input registers and pack them into raw little-endian
+        bytes, without updating the cached registers
+
+        Returns:
+            bytes: raw register values
+        """
+        return pack_registers(self._read_registers(start, count))
+
+    def _read_narrow(
+        self, start: int, count: int, decode: Callable[[bytes], Any]
+    ) -> Any:
+        """
+        Read and decode a single register window, reusing a previous read of
+        the same window that is younger than cache_ttl
+
+        Returns:
+            Any: decoded value
+        """
+        with self._lock:
+            cached = self._narrow_cache.get(start)
+            if cached is not None and time.monotonic() - cached[0] < self.cache_ttl:
+                return cached[1]
+            value = decode(self._read_range(start, count))
+            self._narrow_cache[start] = (time.monotonic(), value)
+        return value
+
+    def read_snapshot(self) -> CPASnapshot:
+        """
+        Read all input registers in a single Modbus transaction and decode
+        every value at once
+
+        Returns:
+            CPASnapshot: decoded register values
+        """
+        return self.refresh()
+
+    def read_snapshots(self, n: int) -> "np.ndarray":
+        """
+        Read the input registers n times and decode all reads at once into a
+        numpy structured array, one record per read. Requires numpy.
+
+        Args:
+            n (int): number of reads
+
+        Returns:
+            np.ndarray: structured array with the raw register fields
+        """
+        try:
+            import numpy as np
+        except ImportError:
+            raise ImportError("read_snapshots requires numpy") from None
+
+        size = REGISTER_BLOCK_SIZE
+        buffer = bytearray(size * n)
+        for index in range(n):
+            buffer[index * size : (index + 1) * size] = self._read_input_registers()
+        return np.frombuffer(buffer, dtype=np.dtype(_SNAPSHOT_DTYPE))
+
+    def read_many(self, *names: str) -> Dict[str, Any]:
+        """
+        Read several properties with a single Modbus transaction. Prefer this
+        over accessing the properties one by one in polling loops.
+
+        Args:
+            *names (str): property names, e.g. "CoolantInTemperature"
+
+        Returns:
+            Dict[str, Any]: property name to value
+        """
+        try:
+            indices = [_SNAPSHOT_FIELDS[name] for name in names]
+        except KeyError as error:
+            raise ValueError(f"Unknown property {error.args[0]!r}") from None
+        snapshot = self.read_snapshot()
+        return {name: snapshot[index] for name, index in zip(names, indices)}
 
     @property
-    @_read_input_register
+    @_read_input_register(0, 1, decode_operating_state)
     def OperatingState(self) -> OperatingState:
-        state = to_int(self._rr.registers[0], 0)
-        for operating_state in OperatingState:
-            if operating_state == state:
-                return operating_state
-        return OperatingState.NA
+        return self._current_snapshot().OperatingState
 
     @property
-    @_read_input_register
+    @_read_input_register(2, 2, decode_warnings)
     def Warnings(self) -> Warnings:
         """
         0: No warnings
@@ -128,13 +429,11 @@ class CPA1110:
         131072: Static Pressure running High
         262144: Static Pressure running Low
         524288: Cold head motor Stall
-        TODO: make this work
         """
-        warning = to_int(self._rr.registers[3], self._rr.registers[2])
-        return Warnings(warning)
+        return self._current_snapshot().Warnings
 
     @property
-    @_read_input_register
+    @_read_input_register(3, 1, decode_errors)
     def Errors(self) -> Errors:
         """
         0: No Errors
@@ -158,34 +457,25 @@ class CPA1110:
         131072: Static Pressure High
         262144: Static Pressure Low
         """
-        error = to_int(self._rr.registers[3], 0)
-        return Errors(error)
+        return self._current_snapshot().Errors
 
     @property
-    @_read_input_register
+    @_read_input_register(28, 1, decode_pressure_units)
     def PressureUnits(self) -> PressureUnits:
-        state = to_int(self._rr.registers[28], 0)
-        for unit in PressureUnits:
-            if state == unit:
-                return unit
-        return PressureUnits.NA
+        return self._current_snapshot().PressureUnits
 
     @property
-    @_read_input_register
+    @_read_input_register(29, 1, decode_temperature_units)
     def TemperatureUnits(self) -> TemperatureUnits:
-        state = to_int(self._rr.registers[29], 0)
-        for unit in TemperatureUnits:
-            if state == unit:
-                return unit
-        return TemperatureUnits.NA
+        return self._current_snapshot().TemperatureUnits
 
     @property
-    @_read_input_register
+    @_read_input_register(30, 1, decode_u16)
     def PanelSerialNumber(self):
-        return to_int(self._rr.registers[30], 0)
+        return self._current_snapshot().PanelSerialNumber
 
     @property
-    @_read_input_register
+    @_read_input_register(31, 1, decode_u16)
     def ModelNumber(self) -> int:
         """
         The upper 8 bits contain the Major model number and
@@ -212,9 +502,9 @@ class CPA1110:
         Example:  A 289C compressor will give a Major of 5
         and a Minor of 18.
         """
-        return to_int(self._rr.registers[31], 0)
+        return self._current_snapshot().ModelNumber
 
     @property
-    @_read_input_register
+    @_read_input_register(32, 1, decode_u16)
     def SoftwareRev(self) -> int:
-        return to_int(self._rr.registers[32], 0)
+        return self._current_snapshot().SoftwareRev
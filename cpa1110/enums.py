@@ -1,4 +1,4 @@
-from enum import IntEnum, auto
+from enum import IntEnum, IntFlag, auto
 
 
 class Connection(IntEnum):
@@ -33,7 +33,7 @@ class OperatingState(IntEnum):
     RECOVERED_FROM_ERROR = 15
 
 
-class Warnings(IntEnum):
+class Warnings(IntFlag):
     NO_WARNINGS = 0
     COOLANT_IN_HIGH = 1
     COOLANT_IN_LOW = 2
@@ -54,7 +54,7 @@ class Warnings(IntEnum):
     COLD_HEAD_MOTOR_STALL = 524288
 
 
-class Errors(IntEnum):
+class Errors(IntFlag):
     NO_WARNINGS = 0
     COOLANT_IN_HIGH = 1
     COOLANT_IN_LOW = 2
@@ -0,0 +1,35 @@
+from typing import NamedTuple
+
+from .enums import (
+    OperatingState,
+    PressureUnits,
+    TemperatureUnits,
+    Warnings,
+    Errors,
+)
+
+
+class CPASnapshot(NamedTuple):
+    """
+    All CPA1110 values decoded from a single read of the input registers
+    """
+
+    OperatingState: OperatingState
+    Warnings: Warnings
+    Errors: Errors
+    CoolantInTemperature: float
+    CoolantOutTemperature: float
+    OilTemperature: float
+    HeliumTemperature: float
+    LowPressure: float
+    LowPressureAverage: float
+    HighPressure: float
+    HighPressureAverage: float
+    DeltaPressureAverage: float
+    MotorCurrent: float
+    HoursOfOperation: float
+    PressureUnits: PressureUnits
+    TemperatureUnits: TemperatureUnits
+    PanelSerialNumber: int
+    ModelNumber: int
+    SoftwareRev: int
@@ -0,0 +1,71 @@
+import struct
+from typing import List, Tuple
+
+import pytest
+from pymodbus import client
+
+from cpa1110 import CPA1110, Connection
+
+FLOATS = [1.5 + index for index in range(11)]
+
+# operating state RUNNING, compressor running, warnings 0x00010005 (high word
+# first), then 11 floats, units, panel serial number, model and software rev
+REGISTERS: List[int] = (
+    [3, 1, 0x0001, 0x0005, 0, 0]
+    + list(struct.unpack("<22H", struct.pack("<11f", *FLOATS)))
+    + [1, 2, 1234, 0x0412, 7]
+)
+
+
+class FakeResponse:
+    def __init__(self, registers: List[int]) -> None:
+        self.registers = registers
+
+    def isError(self) -> bool:
+        return False
+
+
+class FakeClient:
+    """
+    Stand-in for the pymodbus client, recording every transaction
+    """
+
+    def __init__(self, **kwargs) -> None:
+        self.kwargs = kwargs
+        self.registers = list(REGISTERS)
+        self.calls: List[Tuple] = []
+
+    def read_input_registers(self, address: int, count: int = 1, slave: int = 0):
+        self.calls.append(("read", address, count))
+        return FakeResponse(self.registers[address - 1 : address - 1 + count])
+
+    def write_register(self, address: int, value: int, **kwargs) -> None:
+        self.calls.append(("write", address, value))
+
+    def close(self) -> None:
+        self.calls.append(("close",))
+
+    @property
+    def reads(self) -> List[Tuple]:
+        return [call for call in self.calls if call[0] == "read"]
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch) -> Clock:
+    clock = Clock()
+    monkeypatch.setattr("cpa1110.device.time.monotonic", clock)
+    return clock
+
+
+@pytest.fixture
+def compressor(monkeypatch, clock) -> CPA1110:
+    monkeypatch.setattr(client, "ModbusTcpClient", FakeClient)
+    return CPA1110("127.0.0.1", Connection.TCP, cache_ttl=1.0)
@@ -0,0 +1,32 @@
+import struct
+
+import pytest
+
+from cpa1110 import CPA1110, CPASnapshot
+from cpa1110.attributes import FloatProperty, to_int
+
+
+@pytest.mark.parametrize(
+    "low, high", [(0, 0), (5, 0), (0xFFFF, 0), (5, 1), (0xFFFF, 0xFFFF), (0, 0x8000)]
+)
+def test_to_int_matches_struct(low, high):
+    expected = struct.unpack("<i", struct.pack("<HH", low, high))[0]
+    assert to_int(low, high) == expected
+
+
+FLOAT_PROPERTIES = [
+    (name, value)
+    for name, value in vars(CPA1110).items()
+    if isinstance(value, FloatProperty)
+]
+
+
+@pytest.mark.parametrize("name, prop", FLOAT_PROPERTIES)
+def test_float_property_field_matches_name(name, prop):
+    assert CPASnapshot._fields[prop._field] == name
+
+
+@pytest.mark.parametrize("index1", [5, 7, 28])
+def test_float_property_rejects_non_float_registers(index1):
+    with pytest.raises(ValueError):
+        FloatProperty(index1, index1 + 1)
@@ -0,0 +1,63 @@
+import pytest
+
+from cpa1110 import CPASnapshot
+from cpa1110._decode import (
+    REGISTER_BLOCK_SIZE,
+    decode_errors,
+    decode_float,
+    decode_operating_state,
+    decode_pressure_units,
+    decode_snapshot,
+    decode_temperature_units,
+    decode_u16,
+    decode_warnings,
+    pack_registers,
+)
+
+from .conftest import REGISTERS
+
+# snapshot field to the (start, count, decoder) of its narrow register read
+NARROW_DECODERS = [
+    ("OperatingState", 0, 1, decode_operating_state),
+    ("Warnings", 2, 2, decode_warnings),
+    ("Errors", 3, 1, decode_errors),
+    ("PressureUnits", 28, 1, decode_pressure_units),
+    ("TemperatureUnits", 29, 1, decode_temperature_units),
+    ("PanelSerialNumber", 30, 1, decode_u16),
+    ("ModelNumber", 31, 1, decode_u16),
+    ("SoftwareRev", 32, 1, decode_u16),
+] + [
+    (name, 6 + 2 * index, 2, decode_float)
+    for index, name in enumerate(
+        [
+            "CoolantInTemperature",
+            "CoolantOutTemperature",
+            "OilTemperature",
+            "HeliumTemperature",
+            "LowPressure",
+            "LowPressureAverage",
+            "HighPressure",
+            "HighPressureAverage",
+            "DeltaPressureAverage",
+            "MotorCurrent",
+            "HoursOfOperation",
+        ]
+    )
+]
+
+
+def test_pack_registers():
+    raw = pack_registers(REGISTERS)
+    assert len(raw) == REGISTER_BLOCK_SIZE
+    assert pack_registers(REGISTERS[3:5]) == raw[6:10]
+
+
+@pytest.mark.parametrize("name, start, count, decode", NARROW_DECODERS)
+def test_snapshot_matches_narrow_decoders(name, start, count, decode):
+    snapshot = decode_snapshot(pack_registers(REGISTERS))
+    value = decode(pack_registers(REGISTERS[start : start + count]))
+    assert getattr(snapshot, name) == value
+
+
+def test_narrow_decoders_cover_snapshot():
+    assert sorted(name for name, *_ in NARROW_DECODERS) == sorted(CPASnapshot._fields)
@@ -0,0 +1,183 @@
+import threading
+
+import pytest
+from pymodbus import client
+
+from cpa1110 import CPA1110, Connection, OperatingState, Warnings
+
+from .conftest import FLOATS, FakeClient
+
+
+def test_properties(compressor):
+    assert compressor.OperatingState == OperatingState.RUNNING
+    assert compressor.Warnings == Warnings(0x00010005)
+    assert compressor.CoolantInTemperature == FLOATS[0]
+    assert compressor.HoursOfOperation == FLOATS[10]
+    assert compressor.PanelSerialNumber == 1234
+    assert compressor.ModelNumber == 0x0412
+    assert compressor.SoftwareRev == 7
+
+
+def test_reads_within_cache_ttl_are_shared(compressor, clock):
+    compressor.refresh()
+    reads = len(compressor.client.reads)
+    compressor.CoolantInTemperature
+    compressor.OilTemperature
+    compressor.OperatingState
+    assert len(compressor.client.reads) == reads
+
+    clock.now += 1.0
+    compressor.OilTemperature
+    compressor.OperatingState
+    assert len(compressor.client.reads) == reads + 1
+
+
+@pytest.mark.parametrize("control", ["enable_compressor", "disable_compressor"])
+def test_control_write_invalidates_cache(compressor, control):
+    compressor.refresh()
+    reads = len(compressor.client.reads)
+    getattr(compressor, control)()
+    compressor.OperatingState
+    assert len(compressor.client.reads) == reads + 1
+
+
+def test_auto_refresh_disabled(compressor, clock):
+    compressor.auto_refresh = False
+    compressor.refresh()
+    reads = len(compressor.client.reads)
+    clock.now += 10.0
+    compressor.OilTemperature
+    compressor.OperatingState
+    assert len(compressor.client.reads) == reads
+
+
+def test_read_many_uses_one_read(compressor):
+    reads = len(compressor.client.reads)
+    values = compressor.read_many("OilTemperature", "SoftwareRev")
+    assert values == {"OilTemperature": FLOATS[2], "SoftwareRev": 7}
+    assert len(compressor.client.reads) == reads + 1
+
+
+def test_read_many_unknown_property(compressor):
+    with pytest.raises(ValueError):
+        compressor.read_many("Foo")
+
+
+def test_first_access_reads_registers(compressor):
+    assert compressor.client.reads == []
+    compressor.OilTemperature
+    assert len(compressor.client.reads) == 1
+
+
+def test_access_before_first_read_raises(compressor):
+    compressor.auto_refresh = False
+    with pytest.raises(RuntimeError):
+        compressor.OilTemperature
+    with pytest.raises(RuntimeError):
+        compressor.SoftwareRev
+
+
+def test_read_snapshots(compressor):
+    pytest.importorskip("numpy")
+    snapshots = compressor.read_snapshots(3)
+    assert len(compressor.client.reads) == 3
+    assert snapshots.shape == (3,)
+    assert snapshots["SoftwareRev"].tolist() == [7, 7, 7]
+    assert snapshots["OilTemperature"][0] == pytest.approx(FLOATS[2])
+
+
+@pytest.mark.parametrize("narrow_reads", [False, True])
+def test_transactions_within_and_after_cache_ttl(compressor, clock, narrow_reads):
+    compressor.narrow_reads = narrow_reads
+    compressor.OilTemperature
+    compressor.OilTemperature
+    compressor.SoftwareRev
+    compressor.SoftwareRev
+    # narrow reads cache each register window on its own
+    assert len(compressor.client.reads) == (2 if narrow_reads else 1)
+
+    clock.now += 1.0
+    compressor.OilTemperature
+    compressor.SoftwareRev
+    assert len(compressor.client.reads) == (4 if narrow_reads else 2)
+
+
+def test_narrow_reads_only_read_the_property_registers(compressor):
+    compressor.narrow_reads = True
+    assert compressor.OilTemperature == FLOATS[2]
+    assert compressor.Warnings == Warnings(0x00010005)
+    assert compressor.SoftwareRev == 7
+    assert compressor.client.reads == [
+        ("read", 11, 2),
+        ("read", 3, 2),
+        ("read", 33, 1),
+    ]
+
+
+def test_narrow_reads_use_fresh_snapshot(compressor):
+    compressor.narrow_reads = True
+    compressor.refresh()
+    reads = len(compressor.client.reads)
+    compressor.OilTemperature
+    compressor.OperatingState
+    assert len(compressor.client.reads) == reads
+
+
+@pytest.mark.parametrize("control", ["enable_compressor", "disable_compressor"])
+def test_control_write_invalidates_narrow_reads(compressor, control):
+    compressor.narrow_reads = True
+    compressor.OperatingState
+    getattr(compressor, control)()
+    compressor.OperatingState
+    assert compressor.client.reads == [("read", 1, 1), ("read", 1, 1)]
+
+
+def test_context_manager_closes_connection(monkeypatch):
+    monkeypatch.setattr(client, "ModbusTcpClient", FakeClient)
+    with CPA1110("127.0.0.1", Connection.TCP) as compressor:
+        compressor.read_snapshot()
+        assert ("close",) not in compressor.client.calls
+    assert compressor.client.calls[-1] == ("close",)
+
+
+def test_frozen_suppresses_refreshes(compressor, clock):
+    with compressor.frozen():
+        assert len(compressor.client.reads) == 1
+        clock.now += 10.0
+        compressor.OilTemperature
+        compressor.OperatingState
+        assert len(compressor.client.reads) == 1
+    compressor.OilTemperature
+    assert len(compressor.client.reads) == 2
+
+
+def test_frozen_nesting(compressor, clock):
+    with compressor.frozen():
+        with compressor.frozen():
+            clock.now += 10.0
+            compressor.OilTemperature
+        # still inside the outer block
+        compressor.OilTemperature
+        assert len(compressor.client.reads) == 1
+    compressor.OilTemperature
+    assert len(compressor.client.reads) == 2
+
+
+@pytest.mark.parametrize("narrow_reads", [False, True])
+def test_frozen_rereads_after_control_write(compressor, narrow_reads):
+    compressor.narrow_reads = narrow_reads
+    with compressor.frozen():
+        compressor.disable_compressor()
+        compressor.OperatingState
+        assert len(compressor.client.reads) == 2
+        compressor.OperatingState
+        assert len(compressor.client.reads) == 2
+
+
+def test_frozen_is_per_thread(compressor, clock):
+    with compressor.frozen():
+        clock.now += 10.0
+        thread = threading.Thread(target=lambda: compressor.OilTemperature)
+        thread.start()
+        thread.join()
+        assert len(compressor.client.reads) == 2